@@ -0,0 +1,67 @@
+"""Spooky action at a distance: build and inspect a Bell pair.
+
+Entangles two qubits and shows that the outcomes are perfectly
+correlated — always '00' or '11', each with probability one half.
+
+By default the exact probabilities are computed from the statevector,
+which is both noise-free and far cheaper than sampling through Aer.
+Pass --shots N to sample measurement counts instead.
+"""
+
+import argparse
+import os
+
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Statevector
+
+
+def _render_histogram(outcomes, filename):
+    """Save a histogram of `outcomes` to `filename`.
+
+    The plotting stack costs a few hundred milliseconds of import time, so
+    it is imported lazily, and the Agg backend is forced before pyplot
+    loads so the figure goes straight to file with no GUI toolkit startup.
+    Set QC_HEADLESS or QC_RENDER=0 to make rendering a no-op.
+    """
+    if os.environ.get('QC_HEADLESS') or os.environ.get('QC_RENDER', '1') != '1':
+        return
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from qiskit.visualization import plot_histogram
+    fig = plot_histogram(outcomes)
+    fig.savefig(filename, dpi=90)
+    plt.close(fig)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--shots', type=int, default=0,
+                        help='sample this many measurement shots through Aer '
+                             'instead of computing exact probabilities')
+    args = parser.parse_args()
+
+    circuit = QuantumCircuit(2)
+    circuit.h(0)
+    circuit.cx(0, 1)
+    print(circuit)
+
+    if args.shots:
+        # Sampled path, for when shot noise is the point of the exercise.
+        from qiskit_aer import AerSimulator
+        sampled = circuit.copy()
+        sampled.measure_all()
+        simulator = AerSimulator()
+        outcomes = simulator.run(sampled, shots=args.shots).result().get_counts()
+        print(f"Counts over {args.shots} shots: {outcomes}")
+    else:
+        # The state is pure, so the exact outcome distribution is already in
+        # the statevector — no simulator backend and no shot noise needed.
+        outcomes = Statevector.from_instruction(circuit).probabilities_dict()
+        print(f"Exact outcome probabilities: {outcomes}")
+
+    _render_histogram(outcomes, 'spooky_counts.png')
+
+
+if __name__ == '__main__':
+    main()